@@ -1,7 +1,17 @@
+import hashlib
 import os
+import threading
+import ijson
+import orjson
 import requests
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
+from itertools import groupby
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # --- Configuration ---
 SONARR_URL = os.getenv("SONARR_URL")
@@ -10,9 +20,180 @@ RADARR_URL = os.getenv("RADARR_URL")
 RADARR_API_KEY = os.getenv("RADARR_API_KEY")
 SONARR_DAYS_AHEAD = int(os.getenv("SONARR_DAYS_AHEAD", 90))
 RADARR_DAYS_AHEAD = int(os.getenv("RADARR_DAYS_AHEAD", 365))
+AGENDA_CACHE_TTL = int(os.getenv("AGENDA_CACHE_TTL", 60))
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", 300))
+RESPONSE_MAX_AGE = 60
+# Request threads per gunicorn worker; also read by gunicorn.conf.py
+GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", 8))
 
 app = Flask(__name__)
 
+# Upper bound on concurrent Sonarr/Radarr requests per process. Each request
+# thread fans out to both backends at once.
+HTTP_POOL_SIZE = 2 * GUNICORN_THREADS
+
+# Shared HTTP session so Sonarr/Radarr connections are kept alive and reused
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+# Worker pool used to query Sonarr and Radarr concurrently
+EXECUTOR = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE)
+
+# Short-lived caches of Sonarr/Radarr results, keyed by (endpoint, api_key).
+# Agenda entries hold the raw calendar responses; stats entries hold the raw
+# library totals, which get_stats formats per request.
+AGENDA_CACHE = TTLCache(maxsize=8, ttl=AGENDA_CACHE_TTL)
+STATS_CACHE = TTLCache(maxsize=8, ttl=STATS_CACHE_TTL)
+# Validators of the last library listings, used for conditional GETs once the
+# TTL entry has expired: key -> (etag, last_modified, totals)
+_validator_cache = LRUCache(maxsize=8)
+_cache_lock = threading.Lock()
+
+
+def fetch_calendar(endpoint, api_key):
+    """
+    Fetch a Sonarr/Radarr calendar, serving repeated calls from the agenda cache.
+
+    Args:
+        endpoint (str): Full URL of the calendar endpoint.
+        api_key (str): API key sent in the X-Api-Key header.
+
+    Returns:
+        list: Decoded calendar items.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    key = (endpoint, api_key)
+    with _cache_lock:
+        data = AGENDA_CACHE.get(key)
+    if data is not None:
+        return data
+
+    headers = {"X-Api-Key": api_key}
+    response = SESSION.get(endpoint, headers=headers, timeout=10)
+    response.raise_for_status()
+    try:
+        data = orjson.loads(response.content)
+    except orjson.JSONDecodeError as e:
+        raise requests.exceptions.InvalidJSONError(str(e), response=response) from e
+
+    with _cache_lock:
+        AGENDA_CACHE[key] = data
+    return data
+
+
+def iter_json_items(response):
+    """
+    Lazily parse the elements of a streamed top-level JSON array.
+
+    Args:
+        response (requests.Response): Response opened with stream=True.
+
+    Yields:
+        dict: Each array element as soon as it has been parsed.
+    """
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, "item")
+    for chunk in response.iter_content(chunk_size=65536):
+        parser.send(chunk)
+        yield from items
+        del items[:]
+    parser.close()
+    yield from items
+
+
+def fetch_stats(endpoint, api_key, calculate):
+    """
+    Stream a Sonarr/Radarr library listing into a stats calculator, with caching.
+
+    The response is parsed record by record so the full library never has to
+    be held in memory at once. If the previous listing carried an ETag or
+    Last-Modified header, the request is made conditional and a 304 reply
+    reuses the previously computed totals.
+
+    Args:
+        endpoint (str): Full URL of the API endpoint.
+        api_key (str): API key sent in the X-Api-Key header.
+        calculate (callable): Function turning an iterable of records into a
+            dictionary of raw totals.
+
+    Returns:
+        dict: Totals computed by ``calculate``.
+
+    Raises:
+        requests.exceptions.RequestException: If the request fails.
+    """
+    key = (endpoint, api_key)
+    with _cache_lock:
+        stats = STATS_CACHE.get(key)
+        validator = _validator_cache.get(key)
+    if stats is not None:
+        return stats
+
+    headers = {"X-Api-Key": api_key}
+    if validator is not None:
+        etag, last_modified, _ = validator
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    with SESSION.get(endpoint, headers=headers, stream=True, timeout=10) as response:
+        response.raise_for_status()
+        if response.status_code == 304 and validator is not None:
+            stats = validator[2]
+        else:
+            try:
+                stats = calculate(iter_json_items(response))
+            except ijson.JSONError as e:
+                raise requests.exceptions.InvalidJSONError(
+                    str(e), response=response
+                ) from e
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            validator = (etag, last_modified, stats) if etag or last_modified else None
+
+    with _cache_lock:
+        STATS_CACHE[key] = stats
+        if validator is not None:
+            _validator_cache[key] = validator
+        else:
+            _validator_cache.pop(key, None)
+    return stats
+
+
+def ojsonify(obj, cacheable=True):
+    """
+    Serialize an object to a cacheable JSON response using orjson.
+
+    The response carries an ETag of its body, so a client sending a matching
+    If-None-Match header receives a 304 Not Modified without the body.
+
+    Args:
+        obj (list | dict): Data to serialize.
+        cacheable (bool): Whether clients may reuse the response for
+            RESPONSE_MAX_AGE seconds. Responses built from a failed backend
+            fetch are sent with no-cache so they are revalidated every time.
+
+    Returns:
+        Response: JSON response, or 304 response if the client copy is current.
+    """
+    body = orjson.dumps(obj)
+    response = Response(body, mimetype="application/json")
+    response.set_etag(hashlib.blake2b(body, digest_size=16).hexdigest())
+    if cacheable:
+        response.cache_control.max_age = RESPONSE_MAX_AGE
+    else:
+        response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 
 def normalize_sonarr_item(item):
     """
@@ -27,7 +208,7 @@ def normalize_sonarr_item(item):
     series_info = item.get("series", {})
     title = series_info.get("title", "Unknown Show")
     return {
-        "release_datetime": item.get("airDateUtc"),
+        "release_datetime": item.get("airDateUtc") or "",
         "title": title,
         "type": "show",
         "has_file": item.get("hasFile", False),
@@ -51,7 +232,7 @@ def normalize_radarr_item(item):
         release_date = item.get("digitalRelease")
         release_type = "Digital Release"
     return {
-        "release_datetime": release_date,
+        "release_datetime": release_date or "",
         "title": item.get("title"),
         "type": "movie",
         "has_file": item.get("hasFile", False),
@@ -59,6 +240,38 @@ def normalize_radarr_item(item):
     }
 
 
+# Static layout of the fields available to format_ordered_stats: (key, type, value)
+# Headers carry their display text, stats carry the dotted path into the stats dict.
+_FIELD_TEMPLATE = (
+    ("sonarr_header", "header", "TV"),
+    ("sonarr_series", "stat", "sonarr.series"),
+    ("sonarr_ended", "stat", "sonarr.ended"),
+    ("sonarr_continuing", "stat", "sonarr.continuing"),
+    ("sonarr_monitored", "stat", "sonarr.monitored"),
+    ("sonarr_unmonitored", "stat", "sonarr.unmonitored"),
+    ("sonarr_episodes", "stat", "sonarr.episodes"),
+    ("sonarr_files", "stat", "sonarr.files"),
+    ("sonarr_size", "stat", "sonarr.size"),
+    ("radarr_header", "header", "Movies"),
+    ("radarr_movies", "stat", "radarr.movies"),
+    ("radarr_files", "stat", "radarr.files"),
+    ("radarr_monitored", "stat", "radarr.monitored"),
+    ("radarr_unmonitored", "stat", "radarr.unmonitored"),
+    ("radarr_size", "stat", "radarr.size"),
+)
+
+# field key -> (type, value, path, default label), built once at import time
+_FIELD_LOOKUP = {
+    key: (
+        field_type,
+        value,
+        tuple(value.split(".")) if field_type == "stat" else None,
+        value if field_type == "header" else key.replace("_", " ").title(),
+    )
+    for key, field_type, value in _FIELD_TEMPLATE
+}
+
+
 def format_ordered_stats(stats, fields_param):
     """
     Format statistics according to a custom field order specification.
@@ -75,71 +288,18 @@ def format_ordered_stats(stats, fields_param):
     # Check if commas formatting is requested
     use_commas = request.args.get("commas", "").lower() in ["true", "1", "yes"]
 
-    def format_value(value):
-        if (
-            use_commas
-            and isinstance(value, (int, float))
-            and not isinstance(value, str)
-        ):
-            return f"{value:,}"
-        return value
-
-    field_map = {
-        "sonarr_header": {"value": "TV", "type": "header"},
-        "sonarr_series": {
-            "value": format_value(stats["sonarr"]["series"]),
-            "field": "sonarr.series",
-        },
-        "sonarr_ended": {
-            "value": format_value(stats["sonarr"]["ended"]),
-            "field": "sonarr.ended",
-        },
-        "sonarr_continuing": {
-            "value": format_value(stats["sonarr"]["continuing"]),
-            "field": "sonarr.continuing",
-        },
-        "sonarr_monitored": {
-            "value": format_value(stats["sonarr"]["monitored"]),
-            "field": "sonarr.monitored",
-        },
-        "sonarr_unmonitored": {
-            "value": format_value(stats["sonarr"]["unmonitored"]),
-            "field": "sonarr.unmonitored",
-        },
-        "sonarr_episodes": {
-            "value": format_value(stats["sonarr"]["episodes"]),
-            "field": "sonarr.episodes",
-        },
-        "sonarr_files": {
-            "value": format_value(stats["sonarr"]["files"]),
-            "field": "sonarr.files",
-        },
-        "sonarr_size": {
-            "value": stats["sonarr"]["size"],
-            "field": "sonarr.size",
-        },
-        "radarr_header": {"value": "Movies", "type": "header"},
-        "radarr_movies": {
-            "value": format_value(stats["radarr"]["movies"]),
-            "field": "radarr.movies",
-        },
-        "radarr_files": {
-            "value": format_value(stats["radarr"]["files"]),
-            "field": "radarr.files",
-        },
-        "radarr_monitored": {
-            "value": format_value(stats["radarr"]["monitored"]),
-            "field": "radarr.monitored",
-        },
-        "radarr_unmonitored": {
-            "value": format_value(stats["radarr"]["unmonitored"]),
-            "field": "radarr.unmonitored",
-        },
-        "radarr_size": {
-            "value": stats["radarr"]["size"],
-            "field": "radarr.size",
-        },
-    }
+    # Pick the value formatter once instead of re-checking use_commas per field
+    if use_commas:
+
+        def format_value(value):
+            if isinstance(value, (int, float)):
+                return format(value, ",")
+            return value
+
+    else:
+
+        def format_value(value):
+            return value
 
     for field_spec in fields_param.split(","):
         field_spec = field_spec.strip()
@@ -151,65 +311,89 @@ def format_ordered_stats(stats, fields_param):
         else:
             field_key, custom_label = field_spec, None
 
-        # Only process fields that exist in the field_map
-        if field_key in field_map:
-            item = field_map[field_key].copy()
-            # If a custom label is provided, use it
-            if custom_label:
-                item["label"] = custom_label
-            # If not a header, generate a label from the field name
-            elif item.get("type") != "header":
-                item["label"] = field_key.replace("_", " ").title()
-            # For headers, use the value as the label
-            else:
-                item["label"] = item["value"]
-            ordered_data.append(item)
+        # Only process fields that exist in the template
+        template = _FIELD_LOOKUP.get(field_key)
+        if template is None:
+            continue
+        field_type, value, path, default_label = template
+
+        if field_type == "header":
+            item = {"value": value, "type": "header"}
+        else:
+            section, name = path
+            item = {"value": format_value(stats[section][name]), "field": value}
+        # Use the custom label if provided, otherwise the precomputed default
+        item["label"] = custom_label or default_label
+        ordered_data.append(item)
 
     return {"ordered_fields": ordered_data, "error": stats.get("error")}
 
 
+def _get_decimals():
+    """
+    Read the number of decimal places for disk sizes from the request.
+
+    Returns:
+        int: Value of the "decimals" query parameter, defaulting to 1.
+    """
+    return int(request.args.get("decimals", 1))
+
+
+def format_size_tb(total_size, decimal_places):
+    """
+    Format a disk size in bytes as terabytes.
+
+    Args:
+        total_size (int): Size in bytes.
+        decimal_places (int): Decimal places used for the disk size.
+
+    Returns:
+        str: Size such as "1.5 TB".
+    """
+    total_size_tb = total_size / (1000**4) if total_size > 0 else 0
+    return f"{total_size_tb:.{decimal_places}f} TB"
+
+
 def calculate_sonarr_stats(series_data):
     """
     Calculate statistics for Sonarr series data.
 
     Args:
-        series_data (list): List of Sonarr series dictionaries.
+        series_data (iterable): Sonarr series dictionaries.
 
     Returns:
-        dict: Aggregated statistics for series, episodes, files, and disk size.
+        dict: Aggregated statistics for series, episodes, files, and disk size
+            in bytes.
     """
-    total_series = len(series_data)
+    total_series = 0
     series_ended = 0
     series_continuing = 0
     monitored_series = 0
-    unmonitored_series = 0
     total_episodes = 0
     episodes_with_files = 0
     total_size = 0
 
     for series in series_data:
+        total_series += 1
+
         # Series status
-        if series.get("ended", False) or series.get("status") == "ended":
+        status = series.get("status")
+        if series.get("ended", False) or status == "ended":
             series_ended += 1
-        elif series.get("status") == "continuing":
+        elif status == "continuing":
             series_continuing += 1
 
         # Monitoring status
         if series.get("monitored", False):
             monitored_series += 1
-        else:
-            unmonitored_series += 1
 
         # Episode statistics
-        stats = series.get("statistics", {})
+        stats = series.get("statistics") or {}
         total_episodes += stats.get("episodeCount", 0)
         episodes_with_files += stats.get("episodeFileCount", 0)
         total_size += stats.get("sizeOnDisk", 0)
 
-    # Convert size to TB with customizable decimal places
-    decimal_places = int(request.args.get("decimals", 1))
-    total_size_tb = total_size / (1000**4) if total_size > 0 else 0
-    size_formatted = f"{total_size_tb:.{decimal_places}f} TB"
+    unmonitored_series = total_series - monitored_series
 
     return {
         "series": total_series,
@@ -219,7 +403,7 @@ def calculate_sonarr_stats(series_data):
         "unmonitored": unmonitored_series,
         "episodes": total_episodes,
         "files": episodes_with_files,
-        "size": size_formatted,
+        "size": total_size,
     }
 
 
@@ -228,18 +412,20 @@ def calculate_radarr_stats(movies_data):
     Calculate statistics for Radarr movies data.
 
     Args:
-        movies_data (list): List of Radarr movie dictionaries.
+        movies_data (iterable): Radarr movie dictionaries.
 
     Returns:
-        dict: Aggregated statistics for movies, files, monitored status, and disk size.
+        dict: Aggregated statistics for movies, files, monitored status, and disk
+            size in bytes.
     """
-    total_movies = len(movies_data)
+    total_movies = 0
     movies_with_files = 0
     monitored_movies = 0
-    unmonitored_movies = 0
     total_size = 0
 
     for movie in movies_data:
+        total_movies += 1
+
         # File status
         if movie.get("hasFile", False):
             movies_with_files += 1
@@ -247,23 +433,18 @@ def calculate_radarr_stats(movies_data):
         # Monitoring status
         if movie.get("monitored", False):
             monitored_movies += 1
-        else:
-            unmonitored_movies += 1
 
         # Size calculation
         total_size += movie.get("sizeOnDisk", 0)
 
-    # Convert size to TB with customizable decimal places
-    decimal_places = int(request.args.get("decimals", 1))
-    total_size_tb = total_size / (1000**4) if total_size > 0 else 0
-    size_formatted = f"{total_size_tb:.{decimal_places}f} TB"
+    unmonitored_movies = total_movies - monitored_movies
 
     return {
         "movies": total_movies,
         "files": movies_with_files,
         "monitored": monitored_movies,
         "unmonitored": unmonitored_movies,
-        "size": size_formatted,
+        "size": total_size,
     }
 
 
@@ -275,64 +456,58 @@ def get_agenda():
     Returns:
         Response: JSON list of agenda items grouped by date.
     """
-    all_items = []
-
-    start_date = datetime.utcnow().strftime("%Y-%m-%d")
-    sonarr_end_date = (datetime.utcnow() + timedelta(days=SONARR_DAYS_AHEAD)).strftime(
-        "%Y-%m-%d"
-    )
-    radarr_end_date = (datetime.utcnow() + timedelta(days=RADARR_DAYS_AHEAD)).strftime(
-        "%Y-%m-%d"
-    )
-
-    # Fetch data from Sonarr
-    try:
-        sonarr_endpoint = f"{SONARR_URL}/api/v3/calendar?start={start_date}&end={sonarr_end_date}&includeSeries=true"
-        headers = {"X-Api-Key": SONARR_API_KEY}
-        response = requests.get(sonarr_endpoint, headers=headers, timeout=10)
-        response.raise_for_status()
-        sonarr_data = response.json()
-        for item in sonarr_data:
-            all_items.append(normalize_sonarr_item(item))
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching from Sonarr: {e}")
-
-    # Fetch data from Radarr
-    try:
-        radarr_endpoint = (
-            f"{RADARR_URL}/api/v3/calendar?start={start_date}&end={radarr_end_date}"
-        )
-        headers = {"X-Api-Key": RADARR_API_KEY}
-        response = requests.get(radarr_endpoint, headers=headers, timeout=10)
-        response.raise_for_status()
-        radarr_data = response.json()
-        for item in radarr_data:
-            normalized_item = normalize_radarr_item(item)
-            if (
-                normalized_item.get("release_datetime")
-                and normalized_item["release_datetime"][:10] >= start_date
-            ):
-                all_items.append(normalized_item)
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching from Radarr: {e}")
+    now = datetime.utcnow()
+    start_date = now.strftime("%Y-%m-%d")
+    sonarr_end_date = (now + timedelta(days=SONARR_DAYS_AHEAD)).strftime("%Y-%m-%d")
+    radarr_end_date = (now + timedelta(days=RADARR_DAYS_AHEAD)).strftime("%Y-%m-%d")
+
+    def fetch_sonarr():
+        try:
+            sonarr_endpoint = f"{SONARR_URL}/api/v3/calendar?start={start_date}&end={sonarr_end_date}&includeSeries=true"
+            sonarr_data = fetch_calendar(sonarr_endpoint, SONARR_API_KEY)
+            sonarr_items = [normalize_sonarr_item(item) for item in sonarr_data]
+            return [item for item in sonarr_items if item["release_datetime"]], None
+        except requests.exceptions.RequestException as e:
+            app.logger.warning("Error fetching from Sonarr: %s", e)
+            return [], e
+
+    def fetch_radarr():
+        try:
+            radarr_endpoint = (
+                f"{RADARR_URL}/api/v3/calendar?start={start_date}&end={radarr_end_date}"
+            )
+            radarr_data = fetch_calendar(radarr_endpoint, RADARR_API_KEY)
+            radarr_items = [
+                item
+                for item in map(normalize_radarr_item, radarr_data)
+                # ISO-8601 timestamps sort after their own YYYY-MM-DD prefix, and
+                # missing dates ("") sort before any date, so no slicing is needed
+                if item["release_datetime"] >= start_date
+            ]
+            return radarr_items, None
+        except requests.exceptions.RequestException as e:
+            app.logger.warning("Error fetching from Radarr: %s", e)
+            return [], e
+
+    # Fetch data from Sonarr and Radarr in parallel
+    sonarr_future = EXECUTOR.submit(fetch_sonarr)
+    radarr_future = EXECUTOR.submit(fetch_radarr)
+    sonarr_items, sonarr_error = sonarr_future.result()
+    radarr_items, radarr_error = radarr_future.result()
+    all_items = sonarr_items + radarr_items
 
     # Sort all collected items by their release datetime
-    all_items.sort(key=lambda x: x.get("release_datetime"))
-
-    # Group the sorted items by date
-    grouped_agenda = {}
-    for item in all_items:
-        if item.get("release_datetime"):
-            date_key = item["release_datetime"][:10]
-            if date_key not in grouped_agenda:
-                grouped_agenda[date_key] = []
-            grouped_agenda[date_key].append(item)
+    all_items.sort(key=itemgetter("release_datetime"))
 
-    agenda_list = []
-    for date, items in grouped_agenda.items():
-        agenda_list.append({"date": date, "items": items})
+    # Group the sorted items by date in a single pass
+    agenda_list = [
+        {"date": date, "items": list(items)}
+        for date, items in groupby(all_items, key=lambda x: x["release_datetime"][:10])
+    ]
 
-    return jsonify(agenda_list)
+    return ojsonify(
+        agenda_list, cacheable=sonarr_error is None and radarr_error is None
+    )
 
 
 @app.route("/api/stats")
@@ -345,21 +520,45 @@ def get_stats():
     """
     # Get fields parameter for custom ordering
     fields_param = request.args.get("fields", "")
+    decimal_places = _get_decimals()
+    empty_size = f"0.{'0' * decimal_places} TB"
 
     stats = {"sonarr": {}, "radarr": {}, "error": None}
 
-    # Fetch Sonarr series data
-    try:
-        sonarr_endpoint = f"{SONARR_URL}/api/v3/series"
-        headers = {"X-Api-Key": SONARR_API_KEY}
-        response = requests.get(sonarr_endpoint, headers=headers, timeout=10)
-        response.raise_for_status()
-        sonarr_data = response.json()
-        stats["sonarr"] = calculate_sonarr_stats(sonarr_data)
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching Sonarr stats: {e}")
-        stats["error"] = f"Sonarr error: {str(e)}"
-        decimal_places = int(request.args.get("decimals", 1))
+    def fetch_sonarr():
+        try:
+            sonarr_endpoint = f"{SONARR_URL}/api/v3/series?includeSeasonImages=false"
+            totals = fetch_stats(
+                sonarr_endpoint, SONARR_API_KEY, calculate_sonarr_stats
+            )
+            return totals, None
+        except requests.exceptions.RequestException as e:
+            app.logger.warning("Error fetching Sonarr stats: %s", e)
+            return None, e
+
+    def fetch_radarr():
+        try:
+            radarr_endpoint = f"{RADARR_URL}/api/v3/movie"
+            totals = fetch_stats(
+                radarr_endpoint, RADARR_API_KEY, calculate_radarr_stats
+            )
+            return totals, None
+        except requests.exceptions.RequestException as e:
+            app.logger.warning("Error fetching Radarr stats: %s", e)
+            return None, e
+
+    # Fetch Sonarr series and Radarr movies data in parallel
+    sonarr_future = EXECUTOR.submit(fetch_sonarr)
+    radarr_future = EXECUTOR.submit(fetch_radarr)
+
+    sonarr_totals, sonarr_error = sonarr_future.result()
+    if sonarr_error is None:
+        stats["sonarr"] = {
+            **sonarr_totals,
+            "size": format_size_tb(sonarr_totals["size"], decimal_places),
+        }
+    else:
+        stats["error"] = f"Sonarr error: {str(sonarr_error)}"
         stats["sonarr"] = {
             "series": 0,
             "ended": 0,
@@ -368,37 +567,35 @@ def get_stats():
             "unmonitored": 0,
             "episodes": 0,
             "files": 0,
-            "size": f"0.{'0' * decimal_places} TB",
+            "size": empty_size,
         }
 
-    # Fetch Radarr movies data
-    try:
-        radarr_endpoint = f"{RADARR_URL}/api/v3/movie"
-        headers = {"X-Api-Key": RADARR_API_KEY}
-        response = requests.get(radarr_endpoint, headers=headers, timeout=10)
-        response.raise_for_status()
-        radarr_data = response.json()
-        stats["radarr"] = calculate_radarr_stats(radarr_data)
-    except requests.exceptions.RequestException as e:
-        print(f"Error fetching Radarr stats: {e}")
+    radarr_totals, radarr_error = radarr_future.result()
+    if radarr_error is None:
+        stats["radarr"] = {
+            **radarr_totals,
+            "size": format_size_tb(radarr_totals["size"], decimal_places),
+        }
+    else:
         if stats["error"]:
-            stats["error"] += f" | Radarr error: {str(e)}"
+            stats["error"] += f" | Radarr error: {str(radarr_error)}"
         else:
-            stats["error"] = f"Radarr error: {str(e)}"
-        decimal_places = int(request.args.get("decimals", 1))
+            stats["error"] = f"Radarr error: {str(radarr_error)}"
         stats["radarr"] = {
             "movies": 0,
             "files": 0,
             "monitored": 0,
             "unmonitored": 0,
-            "size": f"0.{'0' * decimal_places} TB",
+            "size": empty_size,
         }
 
     # Return ordered format if fields parameter is provided
     if fields_param:
-        return jsonify(format_ordered_stats(stats, fields_param))
+        return ojsonify(
+            format_ordered_stats(stats, fields_param), cacheable=not stats["error"]
+        )
     else:
-        return jsonify(stats)  # Default format
+        return ojsonify(stats, cacheable=not stats["error"])  # Default format
 
 
 if __name__ == "__main__":
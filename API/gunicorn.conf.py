@@ -0,0 +1,9 @@
+# Gunicorn configuration for the Glance Agenda API
+import os
+
+bind = "0.0.0.0:5001"
+workers = 2
+worker_class = "gthread"
+# Shared with app.py, which sizes its HTTP pool from the same variable
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+keepalive = 30